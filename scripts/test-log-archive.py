@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Round-trip check for the dev manager's log files: records written by
+LogArchive must come back unchanged through MappedLogFile, one line each,
+including multi-line records such as a crash's stderr.
+"""
+
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("dev_setup", Path(__file__).parent / "dev-setup.py")
+dev_setup = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(dev_setup)
+
+
+def main():
+    print("🔍 Testing log archive round trip...")
+    texts = ["plain line",
+             "Error: boom\n    at start (app.js:1:1)\r\n    at main (app.js:9:9)",
+             "a literal \\n stays a backslash-n",
+             "trailing newline\n"]
+    start = time.time() - 100
+    with tempfile.TemporaryDirectory() as directory:
+        archive = dev_setup.LogArchive(directory)
+        for i in range(50):
+            text = texts[i % len(texts)]
+            archive.write(dev_setup.LogRecord(i + 1, start + i, 'backend', 'stderr', text))
+        archive.close()
+
+        log_file = dev_setup.MappedLogFile(archive.path('backend'))
+        first, end = log_file.span()
+        if end - first != 50:
+            print(f"❌ Expected 50 lines, found {end - first}")
+            return 1
+        for i, record in enumerate(log_file.window(None, first, end)):
+            if record.text != texts[i % len(texts)] or record.stream != 'stderr':
+                print(f"❌ Record {i} changed: {record.text!r}")
+                return 1
+        print("✅ Multi-line records come back unchanged, one line each")
+
+        lo, hi = log_file.time_range(since=start + 10, until=start + 29)
+        if hi - lo != 20:
+            print(f"❌ Time range returned {hi - lo} records, expected 20")
+            return 1
+        print("✅ Time range stays in order")
+
+        index = dev_setup.LogSearchIndex(directory)
+        index.update()
+        hits = index.search("at main")
+        if len(hits) != 13:
+            print(f"❌ Search in continuation lines found {len(hits)} records, expected 13")
+            return 1
+        print("✅ Search sees text after a newline")
+        log_file.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())